@@ -2,16 +2,21 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from collections.abc import Coroutine
 from dataclasses import dataclass
+from datetime import timedelta
 from pathlib import Path
+from typing import Any
 
 import voluptuous as vol
 
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.config_entries import ConfigEntry, ConfigEntryState
+from homeassistant.core import HomeAssistant, ServiceCall, SupportsResponse
 from homeassistant.exceptions import ConfigEntryNotReady, HomeAssistantError, ServiceValidationError
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.typing import ConfigType
 
 from .const import (
@@ -19,36 +24,61 @@ from .const import (
     CONF_HOST,
     CONF_PORT,
     CONF_MAC,
+    CONF_DEVICE_ID,
     DEFAULT_PORT,
     PLATFORMS,
+    SCAN_INTERVAL,
     SERVICE_SEND_KEY,
     SERVICE_LAUNCH_APP,
+    TOKEN_FILENAME,
     ATTR_KEY,
     ATTR_APP,
 )
 from .coordinator import VidaaTVDataUpdateCoordinator
+from .entity import build_device_info
+from .models import VidaaTVConfigEntry
 
+from vidaa import AsyncVidaaTV
+from vidaa.config import TokenStorage
 from vidaa.keys import ALL_KEYS
 
 _LOGGER = logging.getLogger(__name__)
 
-from vidaa import AsyncVidaaTV
-from vidaa.config import TokenStorage
+# ALL_KEYS is a list upstream; build the lookup set and error text once
+_ALL_KEYS_SET = frozenset(ALL_KEYS)
+_ALL_KEYS_SORTED = ", ".join(sorted(_ALL_KEYS_SET))
 
 
-@dataclass
+@dataclass(slots=True)
 class VidaaTVRuntimeData:
     """Runtime data for Vidaa TV integration."""
 
     coordinator: VidaaTVDataUpdateCoordinator
     tv: AsyncVidaaTV
+    device_info: DeviceInfo
+    connection: tuple[Any, ...]
 
 
-# Python 3.11 compatible type alias (not 3.12+ type statement)
-VidaaTVConfigEntry = ConfigEntry[VidaaTVRuntimeData]
-
 CONFIG_SCHEMA = cv.empty_config_schema(DOMAIN)
 
+SEND_KEY_SCHEMA = vol.Schema({
+    vol.Required(ATTR_KEY): cv.string,
+})
+
+LAUNCH_APP_SCHEMA = vol.Schema({
+    vol.Required(ATTR_APP): cv.string,
+})
+
+
+def _connection_params(entry: ConfigEntry) -> tuple[Any, ...]:
+    """Return the entry data that the TV client and entity ids are built from."""
+    return (
+        entry.data[CONF_HOST],
+        entry.data.get(CONF_PORT, DEFAULT_PORT),
+        entry.data.get(CONF_MAC),
+        entry.data.get(CONF_DEVICE_ID),
+    )
+
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the Vidaa TV integration."""
@@ -64,9 +94,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: VidaaTVConfigEntry) -> b
 
     _LOGGER.debug("Setting up Vidaa TV at %s:%s", host, port)
 
-    # Set up token storage in HA config directory
-    config_dir = Path(hass.config.config_dir)
-    storage = TokenStorage(config_dir / ".vidaa_tv_tokens.json")
+    # Set up token storage in HA config directory (creates the directory on disk)
+    try:
+        storage = await hass.async_add_executor_job(
+            TokenStorage, Path(hass.config.path(TOKEN_FILENAME))
+        )
+    except OSError as err:
+        raise ConfigEntryNotReady("Error setting up token storage") from err
 
     # Create the async TV client (certs are bundled in vidaa-control library)
     tv = AsyncVidaaTV(
@@ -78,33 +112,57 @@ async def async_setup_entry(hass: HomeAssistant, entry: VidaaTVConfigEntry) -> b
         storage=storage,
     )
 
-    # Try to connect
-    try:
-        connected = await tv.async_connect(timeout=10)
-        if not connected:
-            raise ConfigEntryNotReady("Failed to connect to TV")
-    except ConfigEntryNotReady:
-        raise
-    except Exception as err:
-        _LOGGER.debug("Error connecting to TV: %s", err)
-        raise ConfigEntryNotReady("Error connecting to TV") from err
-
     # Create coordinator for data updates
     coordinator = VidaaTVDataUpdateCoordinator(hass, tv, entry)
-    await coordinator.async_config_entry_first_refresh()
 
     # Store runtime data
-    entry.runtime_data = VidaaTVRuntimeData(coordinator=coordinator, tv=tv)
+    entry.runtime_data = VidaaTVRuntimeData(
+        coordinator=coordinator,
+        tv=tv,
+        device_info=build_device_info(entry),
+        connection=_connection_params(entry),
+    )
+
+    # Register update listener for options before platforms are forwarded,
+    # so an unload triggered during setup always removes it
+    entry.async_on_unload(entry.add_update_listener(async_update_options))
 
     # Set up platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
-    # Register update listener for options
-    entry.async_on_unload(entry.add_update_listener(async_update_options))
+    # Connect in the background: an offline TV would otherwise hold up setup
+    # for the whole connect timeout. The coordinator connects (and keeps
+    # retrying on each poll) when the TV is not connected yet.
+    entry.async_create_background_task(
+        hass,
+        coordinator.async_refresh(),
+        name=f"{DOMAIN}_connect_{entry.entry_id}",
+    )
 
     return True
 
 
+async def _async_call_all_tvs(
+    service: str,
+    calls: list[Coroutine[Any, Any, None]],
+    message: str,
+) -> None:
+    """Run per-TV calls concurrently and raise a single error on failure.
+
+    Latency is that of the slowest TV rather than the sum of all of them,
+    and every failure is logged before one HomeAssistantError is raised.
+    """
+    results = await asyncio.gather(*calls, return_exceptions=True)
+    errors = [result for result in results if isinstance(result, BaseException)]
+    if not errors:
+        return
+    for err in errors:
+        if not isinstance(err, Exception):
+            raise err
+        _LOGGER.error("%s failed: %s", service, err)
+    raise HomeAssistantError(message) from errors[0]
+
+
 async def _async_setup_services(hass: HomeAssistant) -> None:
     """Set up services for the integration."""
 
@@ -117,58 +175,59 @@ async def _async_setup_services(hass: HomeAssistant) -> None:
                 translation_key="no_tvs_configured",
             )
 
-        return [
+        # Only loaded entries have runtime_data
+        coordinators = [
             entry.runtime_data.coordinator
             for entry in entries
-            if not entry.state.recoverable
+            if entry.state is ConfigEntryState.LOADED
         ]
+        if not coordinators:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="no_tvs_loaded",
+            )
+        return coordinators
 
     async def async_send_key(call: ServiceCall) -> None:
         """Handle send_key service call."""
         key = call.data[ATTR_KEY]
         # Validate key against known keys
-        if key not in ALL_KEYS:
+        if key not in _ALL_KEYS_SET:
             raise ServiceValidationError(
-                f"Unknown key '{key}'. Must be one of: {', '.join(sorted(ALL_KEYS))}",
+                f"Unknown key '{key}'. Must be one of: {_ALL_KEYS_SORTED}",
             )
-        for coordinator in _get_coordinators(call):
-            try:
-                await coordinator.async_send_key(key)
-            except Exception as err:
-                _LOGGER.error("send_key failed: %s", err)
-                raise HomeAssistantError("Failed to send key to TV") from err
+        await _async_call_all_tvs(
+            SERVICE_SEND_KEY,
+            [coordinator.async_send_key(key) for coordinator in _get_coordinators(call)],
+            "Failed to send key to TV",
+        )
 
     async def async_launch_app(call: ServiceCall) -> None:
         """Handle launch_app service call."""
         app = call.data[ATTR_APP]
-        for coordinator in _get_coordinators(call):
-            try:
-                await coordinator.async_launch_app(app)
-            except Exception as err:
-                _LOGGER.error("launch_app failed: %s", err)
-                raise HomeAssistantError("Failed to launch app on TV") from err
-
-    # Only register services once
-    if not hass.services.has_service(DOMAIN, SERVICE_SEND_KEY):
-        hass.services.async_register(
-            DOMAIN,
-            SERVICE_SEND_KEY,
-            async_send_key,
-            schema=vol.Schema({
-                vol.Required(ATTR_KEY): cv.string,
-            }),
-        )
-
-    if not hass.services.has_service(DOMAIN, SERVICE_LAUNCH_APP):
-        hass.services.async_register(
-            DOMAIN,
+        await _async_call_all_tvs(
             SERVICE_LAUNCH_APP,
-            async_launch_app,
-            schema=vol.Schema({
-                vol.Required(ATTR_APP): cv.string,
-            }),
+            [coordinator.async_launch_app(app) for coordinator in _get_coordinators(call)],
+            "Failed to launch app on TV",
         )
 
+    # async_setup runs once per hass instance, so the services are registered
+    # exactly once here without having to check the registry first
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SEND_KEY,
+        async_send_key,
+        schema=SEND_KEY_SCHEMA,
+        supports_response=SupportsResponse.NONE,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_LAUNCH_APP,
+        async_launch_app,
+        schema=LAUNCH_APP_SCHEMA,
+        supports_response=SupportsResponse.NONE,
+    )
+
 
 async def async_unload_entry(hass: HomeAssistant, entry: VidaaTVConfigEntry) -> bool:
     """Unload a config entry."""
@@ -183,5 +242,19 @@ async def async_unload_entry(hass: HomeAssistant, entry: VidaaTVConfigEntry) ->
 
 
 async def async_update_options(hass: HomeAssistant, entry: VidaaTVConfigEntry) -> None:
-    """Handle options update."""
-    await hass.config_entries.async_reload(entry.entry_id)
+    """Handle options or entry data update.
+
+    Only a change to the connection details needs a full reload; the polling
+    interval is applied to the running coordinator, and model/sw_version
+    updates written by the coordinator itself need nothing at all.
+    """
+    runtime_data = entry.runtime_data
+    if _connection_params(entry) != runtime_data.connection:
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+
+    update_interval = timedelta(
+        seconds=entry.options.get("scan_interval", SCAN_INTERVAL)
+    )
+    if runtime_data.coordinator.update_interval != update_interval:
+        runtime_data.coordinator.update_interval = update_interval
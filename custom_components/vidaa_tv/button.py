@@ -9,12 +9,12 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import BUTTON_KEYS
+from .const import BUTTON_KEYS_PREPARED
 from .coordinator import VidaaTVDataUpdateCoordinator
 from .entity import VidaaTVEntity
 
 if TYPE_CHECKING:
-    from . import VidaaTVConfigEntry
+    from .models import VidaaTVConfigEntry
 
 PARALLEL_UPDATES = 1
 
@@ -27,19 +27,24 @@ async def async_setup_entry(
     """Set up Vidaa TV buttons from a config entry."""
     coordinator = entry.runtime_data.coordinator
     async_add_entities(
-        VidaaTVButton(coordinator, entry, key_id, name, icon, vidaa_key, enabled)
-        for key_id, name, icon, vidaa_key, enabled in BUTTON_KEYS
+        [
+            VidaaTVButton(coordinator, entry, unique_id_suffix, name, icon, vidaa_key, enabled)
+            for _, unique_id_suffix, name, icon, vidaa_key, enabled in BUTTON_KEYS_PREPARED
+        ],
+        update_before_add=False,
     )
 
 
 class VidaaTVButton(VidaaTVEntity, ButtonEntity):
     """Representation of a Vidaa TV remote button."""
 
+    __slots__ = ("_vidaa_key",)
+
     def __init__(
         self,
         coordinator: VidaaTVDataUpdateCoordinator,
         entry: ConfigEntry,
-        key_id: str,
+        unique_id_suffix: str,
         name: str,
         icon: str,
         vidaa_key: str,
@@ -48,7 +53,7 @@ class VidaaTVButton(VidaaTVEntity, ButtonEntity):
         """Initialize the button."""
         super().__init__(coordinator, entry)
         self._vidaa_key = vidaa_key
-        self._attr_unique_id = f"{self._device_id}_button_{key_id}" if self._device_id else f"{entry.entry_id}_button_{key_id}"
+        self._attr_unique_id = self._unique_id_base + unique_id_suffix
         self._attr_name = name
         self._attr_icon = icon
         self._attr_entity_registry_enabled_default = enabled_default
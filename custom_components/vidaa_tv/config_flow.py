@@ -8,6 +8,7 @@ import re
 from collections.abc import Mapping
 from pathlib import Path
 from typing import Any
+from urllib.parse import urlparse
 
 import voluptuous as vol
 
@@ -15,6 +16,7 @@ from homeassistant import config_entries
 from homeassistant.components import ssdp
 from homeassistant.core import callback
 from homeassistant.config_entries import ConfigFlowResult
+from homeassistant.data_entry_flow import AbortFlow
 from homeassistant.helpers.selector import (
     NumberSelector,
     NumberSelectorConfig,
@@ -33,6 +35,7 @@ from .const import (
     DEFAULT_NAME,
     DEFAULT_PORT,
     TIMEOUT_CONNECT,
+    TOKEN_FILENAME,
     SCAN_INTERVAL,
 )
 
@@ -42,6 +45,11 @@ from vidaa import AsyncVidaaTV
 from vidaa.config import TokenStorage
 from vidaa.wol import get_mac_from_ip
 
+# Normalize a hex MAC to upper case with ":" separators in a single pass
+_MAC_NORMALIZE = str.maketrans("-abcdef", ":ABCDEF")
+# "vidaa_support=1" line in the SSDP modelDescription, whitespace tolerant
+_VIDAA_SUPPORT_RE = re.compile(r"^[ \t]*vidaa_support[ \t]*=[ \t]*1[ \t]*\r?$", re.MULTILINE)
+
 
 def _extract_mac_from_device_info(device_info: dict) -> str | None:
     """Extract real MAC address from device_info.
@@ -59,10 +67,21 @@ def _extract_mac_from_device_info(device_info: dict) -> str | None:
         # Fallback: try both
         mac = device_info.get("wlan0") or device_info.get("eth0")
 
-    if mac and re.match(r"([0-9a-fA-F]{2}[:-]){5}[0-9a-fA-F]{2}", mac):
-        return mac.upper().replace("-", ":")
+    if not mac or len(mac) != 17:
+        return None
+
+    # Six hex octets with ":" or "-" between each pair; fromhex validates
+    # the digits
+    if any(mac[i] not in ":-" for i in range(2, 17, 3)):
+        return None
+    octets = [mac[i:i + 2] for i in range(0, 17, 3)]
+    try:
+        if len(bytes.fromhex("".join(octets))) != 6:
+            return None
+    except ValueError:
+        return None
 
-    return None
+    return ":".join(octets).upper()
 
 
 class VidaaTVConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -72,6 +91,9 @@ class VidaaTVConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     MAX_PIN_ATTEMPTS = 5
 
+    # Upper bound on waiting for the TV to show its PIN dialog (seconds)
+    PIN_WAIT_MAX = 1.0
+
     def __init__(self) -> None:
         """Initialize the config flow."""
         self._host: str | None = None
@@ -79,12 +101,22 @@ class VidaaTVConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self._name: str = DEFAULT_NAME
         self._mac: str | None = None
         self._device_id: str | None = None
+        # Config entry unique id derived from _device_id (see _set_device_id)
+        self._device_unique_id: str | None = None
         self._model: str | None = None
         self._sw_version: str | None = None
         self._discovery_info: ssdp.SsdpServiceInfo | None = None
         self._pin_attempts: int = 0
         # Keep single client alive across steps for pairing
         self._tv: AsyncVidaaTV | None = None
+        self._storage: TokenStorage | None = None
+        # Resolved when the TV reports that its PIN dialog is showing
+        self._pin_ready: asyncio.Future[None] | None = None
+
+    def _set_device_id(self, device_id: str | None) -> None:
+        """Set the device id (the TV's MAC) and the unique id derived from it."""
+        self._device_id = device_id
+        self._device_unique_id = device_id.replace(":", "").lower() if device_id else None
 
     async def _async_cleanup_client(self) -> None:
         """Disconnect and clean up any active client."""
@@ -95,6 +127,31 @@ class VidaaTVConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 pass
             self._tv = None
 
+    def _on_auth_required(self) -> None:
+        """Signal that the TV shows its PIN dialog (called from the client thread)."""
+        self.hass.loop.call_soon_threadsafe(self._async_set_pin_ready)
+
+    @callback
+    def _async_set_pin_ready(self) -> None:
+        """Resolve the pending PIN-ready future."""
+        if self._pin_ready is not None and not self._pin_ready.done():
+            self._pin_ready.set_result(None)
+
+    async def _async_start_pairing(self) -> None:
+        """Ask the TV to show a PIN and wait until it does, at most PIN_WAIT_MAX.
+
+        Fast TVs return as soon as they report the PIN dialog instead of
+        after a fixed pause.
+        """
+        self._pin_ready = self.hass.loop.create_future()
+        await self._tv.async_start_pairing()
+        try:
+            await asyncio.wait_for(self._pin_ready, timeout=self.PIN_WAIT_MAX)
+        except TimeoutError:
+            _LOGGER.debug("TV did not confirm PIN dialog within %ss", self.PIN_WAIT_MAX)
+        finally:
+            self._pin_ready = None
+
     async def _async_resolve_mac(self) -> str | None:
         """Resolve MAC address from IP via ARP."""
         if not self._host:
@@ -103,15 +160,22 @@ class VidaaTVConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             loop = asyncio.get_running_loop()
             mac = await loop.run_in_executor(None, get_mac_from_ip, self._host)
             if mac:
-                return mac.upper().replace("-", ":")
+                return mac.translate(_MAC_NORMALIZE)
         except Exception as err:
             _LOGGER.debug("Could not resolve MAC from ARP: %s", err)
         return None
 
-    def _get_storage(self) -> TokenStorage:
-        """Get token storage in HA config directory."""
-        config_dir = Path(self.hass.config.config_dir)
-        return TokenStorage(config_dir / ".vidaa_tv_tokens.json")
+    async def _async_get_storage(self) -> TokenStorage:
+        """Get token storage in HA config directory.
+
+        TokenStorage creates its directory on init, so build it in the executor,
+        once per flow.
+        """
+        if self._storage is None:
+            self._storage = await self.hass.async_add_executor_job(
+                TokenStorage, Path(self.hass.config.path(TOKEN_FILENAME))
+            )
+        return self._storage
 
     async def _async_create_client(self) -> AsyncVidaaTV:
         """Create an AsyncVidaaTV client with current settings.
@@ -124,9 +188,64 @@ class VidaaTVConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             use_dynamic_auth=True,
             mac_address=self._mac,
             enable_persistence=True,
-            storage=self._get_storage(),
+            storage=await self._async_get_storage(),
+            on_auth_required=self._on_auth_required,
         )
 
+    async def _async_begin_pairing(
+        self,
+        *,
+        fetch_device_info: bool = True,
+        unique_id_from_mac: bool = False,
+    ) -> str | None:
+        """Connect to the TV and have it show a pairing PIN.
+
+        Shared by the user, confirm and reauth steps. Returns an error key,
+        or None once the flow can continue with async_step_pair. The client
+        is cleaned up on any failure.
+        """
+        await self._async_cleanup_client()
+        self._tv = await self._async_create_client()
+
+        try:
+            if not await self._tv.async_connect(timeout=TIMEOUT_CONNECT):
+                await self._async_cleanup_client()
+                return "cannot_connect"
+
+            if fetch_device_info:
+                # Get device info to extract real MAC if ARP failed
+                device_info = await self._tv.async_get_device_info(timeout=5)
+                if device_info:
+                    self._name = device_info.get("tv_name") or self._name
+                    self._model = device_info.get("model_name")
+                    self._sw_version = device_info.get("tv_version")
+
+                    info_mac = _extract_mac_from_device_info(device_info)
+                    if info_mac:
+                        self._mac = info_mac
+                        self._set_device_id(info_mac)
+
+            # Use MAC as device_id for uniqueness
+            if unique_id_from_mac and self._mac:
+                self._set_device_id(self._mac)
+                await self.async_set_unique_id(self._device_unique_id)
+                self._abort_if_unique_id_configured(
+                    updates={CONF_HOST: self._host, CONF_PORT: self._port}
+                )
+
+            # Start pairing - TV shows PIN
+            await self._async_start_pairing()
+
+        except AbortFlow:
+            await self._async_cleanup_client()
+            raise
+        except Exception:
+            _LOGGER.exception("Error connecting to TV for pairing")
+            await self._async_cleanup_client()
+            return "unknown"
+
+        return None
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
@@ -155,48 +274,10 @@ class VidaaTVConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             self._mac = await self._async_resolve_mac()
 
             # Connect and start pairing
-            await self._async_cleanup_client()
-            self._tv = await self._async_create_client()
-
-            try:
-                connected = await self._tv.async_connect(timeout=TIMEOUT_CONNECT)
-                if not connected:
-                    errors["base"] = "cannot_connect"
-                else:
-                    # Get device info to extract real MAC if ARP failed
-                    device_info = await self._tv.async_get_device_info(timeout=5)
-                    if device_info:
-                        self._name = device_info.get("tv_name", DEFAULT_NAME)
-                        self._model = device_info.get("model_name")
-                        self._sw_version = device_info.get("tv_version")
-
-                        # Extract MAC from device_info if we don't have one
-                        info_mac = _extract_mac_from_device_info(device_info)
-                        if info_mac:
-                            self._mac = info_mac
-                            self._device_id = self._mac
-
-                    # Use MAC as device_id for uniqueness
-                    if self._mac:
-                        self._device_id = self._mac
-                        await self.async_set_unique_id(
-                            self._mac.replace(":", "").lower()
-                        )
-                        self._abort_if_unique_id_configured(
-                            updates={CONF_HOST: self._host, CONF_PORT: self._port}
-                        )
-
-                    # Start pairing - TV shows PIN
-                    await self._tv.async_start_pairing()
-                    # Brief pause to let PIN appear on TV
-                    await asyncio.sleep(1)
-
-                    return await self.async_step_pair()
-
-            except Exception as err:
-                _LOGGER.debug("Config flow connection error: %s: %s", type(err).__name__, err)
-                errors["base"] = "unknown"
-                await self._async_cleanup_client()
+            error = await self._async_begin_pairing(unique_id_from_mac=True)
+            if error is None:
+                return await self.async_step_pair()
+            errors["base"] = error
 
         return self.async_show_form(
             step_id="user",
@@ -236,26 +317,26 @@ class VidaaTVConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     success = await self._tv.async_authenticate(pin, timeout=10)
 
                     if success:
-                        # Get device info to confirm and update details
-                        device_info = await self._tv.async_get_device_info(timeout=5)
-                        if device_info:
-                            self._name = device_info.get("tv_name") or self._name
-                            self._model = device_info.get("model_name") or self._model
-                            self._sw_version = device_info.get("tv_version") or self._sw_version
-
-                            info_mac = _extract_mac_from_device_info(device_info)
-                            if info_mac:
-                                self._mac = info_mac
-                                self._device_id = self._mac
+                        # Fetch device info only if the earlier step couldn't
+                        # (e.g. reauth, or no MAC from ARP or device info)
+                        if not self._device_id or not self._model:
+                            device_info = await self._tv.async_get_device_info(timeout=5)
+                            if device_info:
+                                self._name = device_info.get("tv_name") or self._name
+                                self._model = device_info.get("model_name") or self._model
+                                self._sw_version = device_info.get("tv_version") or self._sw_version
+
+                                info_mac = _extract_mac_from_device_info(device_info)
+                                if info_mac:
+                                    self._mac = info_mac
+                                    self._set_device_id(info_mac)
 
                         await self._tv.async_disconnect()
                         self._tv = None
 
                         # Set unique ID
                         if self._device_id:
-                            await self.async_set_unique_id(
-                                self._device_id.replace(":", "").lower()
-                            )
+                            await self.async_set_unique_id(self._device_unique_id)
                             self._abort_if_unique_id_configured(
                                 updates={CONF_HOST: self._host, CONF_PORT: self._port}
                             )
@@ -285,8 +366,7 @@ class VidaaTVConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                         errors["base"] = "invalid_pin"
                         # Re-trigger pairing so TV shows PIN again
                         try:
-                            await self._tv.async_start_pairing()
-                            await asyncio.sleep(1)
+                            await self._async_start_pairing()
                         except Exception:
                             _LOGGER.debug("Could not re-trigger PIN")
 
@@ -316,23 +396,13 @@ class VidaaTVConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         # Check for vidaa_support=1 in modelDescription
         model_desc = discovery_info.upnp.get("modelDescription", "")
-        vidaa_support = False
-        for line in model_desc.split("\n"):
-            if "=" in line:
-                key, _, value = line.partition("=")
-                if key.strip() == "vidaa_support" and value.strip() == "1":
-                    vidaa_support = True
-                    break
-
-        if not vidaa_support:
+        if not _VIDAA_SUPPORT_RE.search(model_desc):
             return self.async_abort(reason="not_vidaa_tv")
 
         # Extract host
         self._host = discovery_info.ssdp_headers.get("_host") or discovery_info.ssdp_location
         if self._host and "://" in self._host:
-            from urllib.parse import urlparse
-            parsed = urlparse(self._host)
-            self._host = parsed.hostname
+            self._host = urlparse(self._host).hostname
 
         if not self._host:
             return self.async_abort(reason="no_host")
@@ -361,34 +431,9 @@ class VidaaTVConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             self._mac = await self._async_resolve_mac()
 
             # Connect and start pairing
-            await self._async_cleanup_client()
-            self._tv = await self._async_create_client()
-
-            try:
-                connected = await self._tv.async_connect(timeout=TIMEOUT_CONNECT)
-                if not connected:
-                    return self.async_abort(reason="cannot_connect")
-
-                device_info = await self._tv.async_get_device_info(timeout=5)
-                if device_info:
-                    self._name = device_info.get("tv_name") or self._name
-                    self._model = device_info.get("model_name")
-                    self._sw_version = device_info.get("tv_version")
-
-                    info_mac = _extract_mac_from_device_info(device_info)
-                    if info_mac:
-                        self._mac = info_mac
-                        self._device_id = self._mac
-
-                await self._tv.async_start_pairing()
-                await asyncio.sleep(1)
-
-                return await self.async_step_pair()
-
-            except Exception:
-                _LOGGER.exception("Error connecting for SSDP pairing")
-                await self._async_cleanup_client()
+            if await self._async_begin_pairing() is not None:
                 return self.async_abort(reason="cannot_connect")
+            return await self.async_step_pair()
 
         return self.async_show_form(
             step_id="confirm",
@@ -405,7 +450,7 @@ class VidaaTVConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self._host = entry_data[CONF_HOST]
         self._port = entry_data.get(CONF_PORT, DEFAULT_PORT)
         self._mac = entry_data.get(CONF_MAC)
-        self._device_id = entry_data.get(CONF_DEVICE_ID)
+        self._set_device_id(entry_data.get(CONF_DEVICE_ID))
         return await self.async_step_reauth_confirm()
 
     async def async_step_reauth_confirm(
@@ -413,22 +458,10 @@ class VidaaTVConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     ) -> ConfigFlowResult:
         """Confirm reauth and trigger pairing."""
         if user_input is not None:
-            await self._async_cleanup_client()
-            self._tv = await self._async_create_client()
-
-            try:
-                connected = await self._tv.async_connect(timeout=TIMEOUT_CONNECT)
-                if not connected:
-                    return self.async_abort(reason="cannot_connect")
-
-                await self._tv.async_start_pairing()
-                await asyncio.sleep(1)
-                return await self.async_step_pair()
-
-            except Exception:
-                _LOGGER.exception("Error during reauth")
-                await self._async_cleanup_client()
+            # Identity comes from the entry; async_step_pair fetches the rest
+            if await self._async_begin_pairing(fetch_device_info=False) is not None:
                 return self.async_abort(reason="cannot_connect")
+            return await self.async_step_pair()
 
         return self.async_show_form(
             step_id="reauth_confirm",
@@ -18,6 +18,9 @@ CONF_SW_VERSION: Final = "sw_version"
 DEFAULT_PORT: Final = 36669
 DEFAULT_NAME: Final = "Vidaa TV"
 
+# Token storage file in the HA config directory
+TOKEN_FILENAME: Final = ".vidaa_tv_tokens.json"
+
 # Timeouts
 TIMEOUT_CONNECT: Final = 10
 TIMEOUT_COMMAND: Final = 5
@@ -47,7 +50,7 @@ PLATFORMS: Final = [
 ]
 
 # Button key definitions: (key_id, name, icon, vidaa_key, enabled_by_default)
-BUTTON_KEYS: Final = [
+BUTTON_KEYS: Final = (
     # Navigation
     ("up", "Up", "mdi:arrow-up", "KEY_UP", True),
     ("down", "Down", "mdi:arrow-down", "KEY_DOWN", True),
@@ -88,4 +91,11 @@ BUTTON_KEYS: Final = [
     # Extras (disabled by default)
     ("subtitle", "Subtitle", "mdi:subtitles", "KEY_SUBTITLE", False),
     ("power", "Power", "mdi:power", "KEY_POWER", True),
-]
+)
+
+# BUTTON_KEYS with the unique_id suffix pre-built:
+# (key_id, unique_id_suffix, name, icon, vidaa_key, enabled_by_default)
+BUTTON_KEYS_PREPARED: Final = tuple(
+    (key_id, f"_button_{key_id}", name, icon, vidaa_key, enabled)
+    for key_id, name, icon, vidaa_key, enabled in BUTTON_KEYS
+)
@@ -2,23 +2,47 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
 from datetime import timedelta
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryAuthFailed, HomeAssistantError
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from vidaa import APPS, AsyncVidaaTV
 from vidaa.wol import wake_tv
-from .const import DOMAIN, SCAN_INTERVAL, STATE_FAKE_SLEEP, CONF_MAC, CONF_HOST, CONF_DEVICE_ID
+from .const import (
+    DOMAIN,
+    SCAN_INTERVAL,
+    STATE_FAKE_SLEEP,
+    TIMEOUT_COMMAND,
+    CONF_MAC,
+    CONF_HOST,
+    CONF_DEVICE_ID,
+    CONF_MODEL,
+    CONF_SW_VERSION,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+# Display name for each known app, keyed by lowercase app name
+_APP_DISPLAY_NAMES: dict[str, str] = {
+    key: app.get("name", key) for key, app in APPS.items()
+}
+
+
+class VidaaTVAuthRequired(Exception):
+    """The TV rejected the stored credentials and wants a new PIN."""
+
+
+async def _async_noop() -> None:
+    """Stand in for a query that is skipped."""
+
 
 class VidaaTVDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Coordinator to manage data updates from Vidaa TV."""
@@ -44,6 +68,23 @@ class VidaaTVDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self._available = True
         self._device_info_fetched = False
         self._auth_failures = 0
+        # WoL target, fixed for the lifetime of the entry (changes trigger a reload)
+        host = entry.data.get(CONF_HOST, "")
+        self._wol_mac: str | None = entry.data.get(CONF_MAC)
+        self._wol_subnet = host.rsplit(".", 1)[0] if "." in host else None
+        # Whether the TV was on at the last poll (decides if volume is queried)
+        self._last_on = True
+        # Key presses waiting for the next batch flush
+        self._pending_keys: list[tuple[str, asyncio.Future[None]]] = []
+        self._flush_task: asyncio.Task[None] | None = None
+        self._send_lock = asyncio.Lock()
+        # VidaaTV.connect() tears down the client's session first, so only
+        # one reconnect may run at a time
+        self._connect_lock = asyncio.Lock()
+        # vidaa-control answers get_volume and every _request-based query
+        # (device info, sources) through one shared response slot, so only
+        # one of them may be in flight at a time
+        self._request_lock = asyncio.Lock()
 
     @property
     def available(self) -> bool:
@@ -51,15 +92,26 @@ class VidaaTVDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         return self._available
 
     async def _async_update_device_info(self) -> None:
-        """Fetch and update device info in the device registry."""
-        if self._device_info_fetched:
-            return
+        """Fetch and update device info in the device registry.
 
+        Runs as a background task; it is retried on the next poll if the
+        TV returned nothing or the fetch failed.
+        """
         try:
-            device_info = await self.tv.async_get_device_info(timeout=5)
+            device_info = await self.async_get_device_info(timeout=5)
             _LOGGER.debug("Got device info for %s", self.entry.data.get(CONF_HOST))
 
-            if not device_info:
+            if not isinstance(device_info, dict):
+                self._device_info_fetched = False
+                return
+
+            model = device_info.get("model_name")
+            sw_version = device_info.get("tv_version")
+            name = device_info.get("tv_name")
+
+            # Any other reply (e.g. a stray volume payload) is not device info
+            if not (model or sw_version or name):
+                self._device_info_fetched = False
                 return
 
             # Use MAC from config entry as primary identifier
@@ -72,25 +124,15 @@ class VidaaTVDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 device_id = device_info.get(f"{network_type}0") or device_info.get("wlan0") or device_info.get("eth0")
 
             # Update device registry
+            # One lookup matching either the device id or the entry id
             device_registry = dr.async_get(self.hass)
-            device_entry = None
-
+            identifiers = {(DOMAIN, self.entry.entry_id)}
             if device_id:
-                device_entry = device_registry.async_get_device(
-                    identifiers={(DOMAIN, device_id)}
-                )
-
-            if not device_entry:
-                device_entry = device_registry.async_get_device(
-                    identifiers={(DOMAIN, self.entry.entry_id)}
-                )
+                identifiers.add((DOMAIN, device_id))
+            device_entry = device_registry.async_get_device(identifiers=identifiers)
 
             if device_entry:
                 updates = {}
-                model = device_info.get("model_name")
-                sw_version = device_info.get("tv_version")
-                name = device_info.get("tv_name")
-
                 if model and model != device_entry.model:
                     updates["model"] = model
                 if sw_version and sw_version != device_entry.sw_version:
@@ -102,43 +144,122 @@ class VidaaTVDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     device_registry.async_update_device(device_entry.id, **updates)
                     device_registry.async_schedule_save()
 
-                    new_data = dict(self.entry.data)
-                    if model:
-                        new_data["model"] = model
-                    if sw_version:
-                        new_data["sw_version"] = sw_version
-                    if device_id:
-                        new_data["device_id"] = device_id
-                    self.hass.config_entries.async_update_entry(self.entry, data=new_data)
-
-            self._device_info_fetched = True
+                    # Only copy the entry data if something in it changes
+                    entry_updates = {
+                        key: value
+                        for key, value in (
+                            (CONF_MODEL, model),
+                            (CONF_SW_VERSION, sw_version),
+                            (CONF_DEVICE_ID, device_id),
+                        )
+                        if value and self.entry.data.get(key) != value
+                    }
+                    if entry_updates:
+                        self.hass.config_entries.async_update_entry(
+                            self.entry, data={**self.entry.data, **entry_updates}
+                        )
 
         except Exception as err:
+            self._device_info_fetched = False
             _LOGGER.warning("Error fetching device info: %s", err)
 
+    async def _async_ensure_connected(
+        self, timeout: float, *, wait: bool = True, try_fallback: bool = True
+    ) -> bool:
+        """Reuse the open TV connection, reconnecting only if it dropped.
+
+        With wait=False the caller gives up instead of queueing behind a
+        reconnect that is already in flight.
+        """
+        if self.tv.is_connected:
+            return True
+        if not wait and self._connect_lock.locked():
+            return False
+
+        async with self._connect_lock:
+            # Another caller may have reconnected while this one waited
+            if self.tv.is_connected:
+                return True
+
+            # async_connect tears down the stale MQTT session itself, so there
+            # is no separate disconnect round-trip before reconnecting
+            _LOGGER.debug("TV disconnected, attempting reconnect")
+            return await self.tv.async_connect(
+                timeout=timeout, try_fallback=try_fallback
+            )
+
+    async def _async_ensure_command_connection(self) -> None:
+        """Make sure a command can be sent, without stalling on a dead TV.
+
+        Commands don't wait for a reconnect the poll already started and
+        skip the library's auth-method fallback.
+        """
+        if not await self._async_ensure_connected(
+            timeout=TIMEOUT_COMMAND, wait=False, try_fallback=False
+        ):
+            raise HomeAssistantError("Failed to connect to TV")
+
+    def _auth_rejected(self) -> bool:
+        """Return True if a failed connect looks like rejected credentials.
+
+        vidaa-control raises no typed auth errors. Its needs_authentication()
+        flag is also set when the TV shows a PIN dialog for any other client,
+        and it is only cleared by a token for this one. So the flag only counts
+        after a failed connect, and only while the last state the TV
+        broadcast is still its PIN screen.
+        """
+        if not self.tv.needs_authentication():
+            return False
+        return (self.tv.state or {}).get("statetype") == "authentication"
+
+    async def _async_get_volume(self) -> int | None:
+        """Read the volume while holding the shared response slot.
+
+        Returns None without waiting if another query (device info, sources)
+        holds the slot; the poll then uses the cached volume instead.
+        """
+        if self._request_lock.locked():
+            return None
+        async with self._request_lock:
+            return await self.tv.async_get_volume(timeout=1)
+
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from TV."""
         start = time.monotonic()
 
         try:
-            if not self.tv.is_connected:
-                _LOGGER.debug("TV disconnected, attempting reconnect")
-                try:
-                    await self.tv.async_disconnect()
-                except Exception:
-                    pass
-                connected = await self.tv.async_connect(timeout=5)
-                if not connected:
-                    self._available = False
-                    raise UpdateFailed("Failed to connect to TV")
+            if not await self._async_ensure_connected(timeout=5):
+                self._available = False
+                if self._auth_rejected():
+                    raise VidaaTVAuthRequired("TV is requesting authentication")
+                raise UpdateFailed("Failed to connect to TV")
 
             self._available = True
-
-            # Update device info on first successful connection
-            await self._async_update_device_info()
-
-            # Get current state
-            state = await self.tv.async_get_state(timeout=3)
+            self._auth_failures = 0
+
+            # State arrives on the broadcast topic rather than the shared
+            # response slot, so it can be queried alongside the volume.
+            # Volume is only requested if the TV was on at the previous poll.
+            state, volume_result = await asyncio.gather(
+                self.tv.async_get_state(timeout=3),
+                self._async_get_volume() if self._last_on else _async_noop(),
+                return_exceptions=True,
+            )
+            if isinstance(state, BaseException):
+                raise state
+
+            # Update device info on first successful connection, without
+            # holding up the poll: it starts once this poll's volume read is
+            # done, since both use the shared response slot. The flag is set
+            # first so polls that run before the task finishes don't start
+            # another one.
+            if not self._device_info_fetched:
+                self._device_info_fetched = True
+                self.entry.async_create_background_task(
+                    self.hass,
+                    self._async_update_device_info(),
+                    name=f"{DOMAIN}_device_info_{self.entry.entry_id}",
+                )
 
             # Determine power state
             is_on = True
@@ -147,16 +268,24 @@ class VidaaTVDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     is_on = False
             else:
                 is_on = False
+            self._last_on = is_on
 
-            # Get volume (only if TV is on)
+            # Volume only counts if the TV is on
             volume = None
             is_muted = False
             if is_on:
-                try:
-                    volume = await self.tv.async_get_volume(timeout=1)
-                    is_muted = self.tv.is_muted
-                except Exception as err:
-                    _LOGGER.debug("get_volume failed: %s", err)
+                if isinstance(volume_result, BaseException):
+                    _LOGGER.debug("get_volume failed: %s", volume_result)
+                    volume_result = None
+                # A skipped read (the TV just turned on, or the response slot
+                # was busy) or a failed one falls back to the last volume the
+                # TV broadcast
+                volume = (
+                    volume_result
+                    if volume_result is not None
+                    else self.tv.cached_volume
+                )
+                is_muted = self.tv.is_muted
 
             # Extract current app or source
             statetype = state.get("statetype") if state else None
@@ -164,11 +293,8 @@ class VidaaTVDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             source = None
             if state:
                 if statetype == "app":
-                    app_key = state.get("name", "").lower()
-                    if app_key in APPS:
-                        app = APPS[app_key].get("name", app_key)
-                    else:
-                        app = state.get("name", "").capitalize()
+                    app_name = state.get("name", "")
+                    app = _APP_DISPLAY_NAMES.get(app_name.lower()) or app_name.capitalize()
                 elif statetype == "sourceswitch":
                     source = state.get("displayname") or state.get("sourcename")
 
@@ -186,73 +312,181 @@ class VidaaTVDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                          is_on, statetype, volume, app, source, time.monotonic() - start)
             return data
 
+        except VidaaTVAuthRequired as err:
+            self._available = False
+            self._auth_failures += 1
+            if self._auth_failures >= 3:
+                raise ConfigEntryAuthFailed(
+                    "Authentication failed. Please re-pair with the TV."
+                ) from err
+            raise UpdateFailed(f"Error communicating with TV: {err}") from err
         except Exception as err:
             self._available = False
-            error_str = str(err).lower()
-            if "auth" in error_str or "unauthorized" in error_str or "forbidden" in error_str:
-                self._auth_failures += 1
-                if self._auth_failures >= 3:
-                    raise ConfigEntryAuthFailed(
-                        "Authentication failed. Please re-pair with the TV."
-                    ) from err
             raise UpdateFailed(f"Error communicating with TV: {err}") from err
 
-    async def async_turn_on(self) -> None:
-        """Turn TV on using WoL and power command."""
-        # Use MAC directly from config entry
-        mac = self.entry.data.get(CONF_MAC)
-        if mac:
-            host = self.entry.data.get(CONF_HOST, "")
-            subnet = host.rsplit(".", 1)[0] if "." in host else None
-            _LOGGER.debug("Sending WoL to %s", mac)
-            await self.hass.async_add_executor_job(wake_tv, mac, subnet)
-
-        await self.tv.async_power_on()
+    @callback
+    def async_set_optimistic(self, **values: Any) -> None:
+        """Apply a state change a command just made, ahead of the next poll."""
+        if self.data is None:
+            return
+        self.data.update(values)
+        self.async_update_listeners()
+
+    async def async_turn_on(self) -> bool:
+        """Turn TV on using WoL and power command.
+
+        Like the other command methods, returns whether vidaa-control sent
+        the command; it returns False rather than raising when it could not.
+        """
+        if self._wol_mac:
+            _LOGGER.debug("Sending WoL to %s", self._wol_mac)
+            await self.hass.async_add_executor_job(wake_tv, self._wol_mac, self._wol_subnet)
+
+        sent = await self.tv.async_power_on()
         await self.async_request_refresh()
+        return sent
 
-    async def async_turn_off(self) -> None:
+    async def async_turn_off(self) -> bool:
         """Turn TV off."""
-        await self.tv.async_power_off()
+        sent = await self.tv.async_power_off()
         await self.async_request_refresh()
+        return sent
 
-    async def async_volume_up(self) -> None:
+    async def async_volume_up(self) -> bool:
         """Increase volume."""
-        await self.tv.async_volume_up()
+        sent = await self.tv.async_volume_up()
         await self.async_request_refresh()
+        return sent
 
-    async def async_volume_down(self) -> None:
+    async def async_volume_down(self) -> bool:
         """Decrease volume."""
-        await self.tv.async_volume_down()
+        sent = await self.tv.async_volume_down()
         await self.async_request_refresh()
+        return sent
 
-    async def async_mute(self) -> None:
+    async def async_mute(self) -> bool:
         """Toggle mute."""
-        await self.tv.async_mute()
+        sent = await self.tv.async_mute()
         await self.async_request_refresh()
+        return sent
 
-    async def async_set_volume(self, volume: int) -> None:
+    async def async_set_volume(self, volume: int) -> bool:
         """Set volume level."""
-        await self.tv.async_set_volume(volume)
+        sent = await self.tv.async_set_volume(volume)
         await self.async_request_refresh()
+        return sent
 
-    async def async_select_source(self, source: str) -> None:
+    async def async_select_source(self, source: str) -> bool:
         """Select input source."""
-        await self.tv.async_set_source(source)
+        sent = await self.tv.async_set_source(source)
         await self.async_request_refresh()
+        return sent
 
     async def async_send_key(self, key: str) -> None:
-        """Send remote key."""
-        await self.tv.async_send_key(key)
-
-    async def async_launch_app(self, app_name: str) -> None:
-        """Launch app."""
-        await self.tv.async_launch_app(app_name)
+        """Send remote key.
+
+        A press goes out straight away. Presses made while an earlier batch
+        is still being sent are queued and sent together, in order, in a
+        single executor job.
+        """
+        future: asyncio.Future[None] = self.hass.loop.create_future()
+        self._pending_keys.append((key, future))
+        # Tasks start eagerly, so a flush may already have finished by the
+        # time its Task object is stored here
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = self.hass.async_create_task(self._async_flush_keys())
+        await future
+
+    async def _async_flush_keys(self) -> None:
+        """Send pending key presses until the queue is empty."""
+        try:
+            while self._pending_keys:
+                pending, self._pending_keys = self._pending_keys, []
+                await self._async_send_key_batch(pending)
+        finally:
+            if self._flush_task is asyncio.current_task():
+                self._flush_task = None
+
+    async def _async_send_key_batch(
+        self, pending: list[tuple[str, asyncio.Future[None]]]
+    ) -> None:
+        """Send one batch of key presses and resolve their waiters."""
+        try:
+            # Reconnect lazily so a dropped connection doesn't fail the batch
+            await self._async_ensure_command_connection()
+            async with self._send_lock:
+                await self.hass.async_add_executor_job(
+                    self._send_keys_blocking, [key for key, _ in pending]
+                )
+        except asyncio.CancelledError:
+            for _, future in pending:
+                future.cancel()
+            raise
+        except Exception as err:
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(err)
+        else:
+            for _, future in pending:
+                if not future.done():
+                    future.set_result(None)
+
+    async def async_send_keys(self, keys: list[str], delay: float) -> None:
+        """Send a sequence of remote keys over one connection.
+
+        The connection is checked once up front rather than per key, and
+        the lock keeps the sequence from interleaving with batched presses.
+        """
+        await self._async_ensure_command_connection()
+        async with self._send_lock:
+            for index, key in enumerate(keys):
+                if index and delay > 0:
+                    await asyncio.sleep(delay)
+                await self.tv.async_send_key(key)
+
+    async def async_send_keys_burst(self, keys: list[str]) -> None:
+        """Send a sequence of remote keys back to back.
+
+        Publishing only queues the message on the MQTT client, so all keys
+        go out from a single executor job instead of one hop per key.
+        """
+        await self._async_ensure_command_connection()
+        async with self._send_lock:
+            await self.hass.async_add_executor_job(self._send_keys_blocking, keys)
+
+    def _send_keys_blocking(self, keys: list[str]) -> None:
+        """Publish each key in turn (runs in the executor)."""
+        for key in keys:
+            self.tv.send_key(key)
+
+    async def async_shutdown(self) -> None:
+        """Cancel any queued key presses and shut down the coordinator."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        pending, self._pending_keys = self._pending_keys, []
+        for _, future in pending:
+            future.cancel()
+        await super().async_shutdown()
+
+    async def async_launch_app(self, app: str | dict[str, Any]) -> bool:
+        """Launch app by name, or by its launch payload (appId, name, url)."""
+        sent = await self.tv.async_launch_app(app)
         await self.async_request_refresh()
+        return sent
 
     async def async_get_apps(self) -> list[dict] | None:
         """Get available apps."""
         return await self.tv.async_get_apps()
 
+    async def async_get_device_info(self, timeout: float = 5) -> dict | None:
+        """Get device info (model, name, version)."""
+        # get_device_info answers through the shared response slot
+        async with self._request_lock:
+            return await self.tv.async_get_device_info(timeout=timeout)
+
     async def async_get_sources(self) -> list[dict] | None:
         """Get available sources."""
-        return await self.tv.async_get_sources()
+        # get_sources answers through the shared response slot
+        async with self._request_lock:
+            return await self.tv.async_get_sources()
@@ -7,7 +7,7 @@ from typing import Any
 from homeassistant.components.diagnostics import async_redact_data
 from homeassistant.core import HomeAssistant
 
-from . import VidaaTVConfigEntry
+from .models import VidaaTVConfigEntry
 
 TO_REDACT = {
     "mac",
@@ -30,7 +30,7 @@ async def async_get_config_entry_diagnostics(
     device_info = None
     if tv and tv.is_connected:
         try:
-            device_info = await tv.async_get_device_info(timeout=5)
+            device_info = await coordinator.async_get_device_info(timeout=5)
         except Exception:
             pass
 
@@ -20,40 +20,47 @@ from .const import (
 from .coordinator import VidaaTVDataUpdateCoordinator
 
 if TYPE_CHECKING:
-    from . import VidaaTVConfigEntry
+    from .models import VidaaTVConfigEntry
+
+
+def build_device_info(entry: ConfigEntry) -> DeviceInfo:
+    """Build the device info shared by all entities of a config entry."""
+    mac = entry.data.get(CONF_MAC)
+    device_id = entry.data.get(CONF_DEVICE_ID) or mac
+
+    info = DeviceInfo(
+        identifiers={(DOMAIN, device_id or entry.entry_id)},
+        name=entry.data.get(CONF_NAME, DEFAULT_NAME),
+        manufacturer="Hisense",
+        model=entry.data.get(CONF_MODEL),
+        sw_version=entry.data.get(CONF_SW_VERSION),
+    )
+
+    if mac:
+        info["connections"] = {(CONNECTION_NETWORK_MAC, mac.lower())}
+
+    return info
 
 
 class VidaaTVEntity(CoordinatorEntity[VidaaTVDataUpdateCoordinator]):
     """Base class for all Vidaa TV entities."""
 
+    # HA's Entity still has a __dict__; slots only make these lookups cheaper
+    __slots__ = ("_device_id", "_entry", "_mac", "_unique_id_base")
+
     _attr_has_entity_name = True
 
     def __init__(
         self,
         coordinator: VidaaTVDataUpdateCoordinator,
-        entry: ConfigEntry,
+        entry: VidaaTVConfigEntry,
     ) -> None:
         """Initialize the entity."""
         super().__init__(coordinator)
         self._entry = entry
         self._mac = entry.data.get(CONF_MAC)
         self._device_id = entry.data.get(CONF_DEVICE_ID) or self._mac
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        device_id = self._entry.data.get(CONF_DEVICE_ID) or self._mac
-        mac = self._entry.data.get(CONF_MAC)
-
-        info = DeviceInfo(
-            identifiers={(DOMAIN, device_id or self._entry.entry_id)},
-            name=self._entry.data.get(CONF_NAME, DEFAULT_NAME),
-            manufacturer="Hisense",
-            model=self._entry.data.get(CONF_MODEL),
-            sw_version=self._entry.data.get(CONF_SW_VERSION),
-        )
-
-        if mac:
-            info["connections"] = {(CONNECTION_NETWORK_MAC, mac.lower())}
-
-        return info
+        # Prefix for the unique ids of this entry's entities
+        self._unique_id_base: str = self._device_id or entry.entry_id
+        # Built once per config entry; Entity.device_info returns it as is
+        self._attr_device_info = entry.runtime_data.device_info
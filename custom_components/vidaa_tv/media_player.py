@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import TYPE_CHECKING, Any
 
@@ -12,14 +13,14 @@ from homeassistant.components.media_player import (
     MediaPlayerState,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .coordinator import VidaaTVDataUpdateCoordinator
 from .entity import VidaaTVEntity
 
 if TYPE_CHECKING:
-    from . import VidaaTVConfigEntry
+    from .models import VidaaTVConfigEntry
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -39,6 +40,13 @@ async def async_setup_entry(
 class VidaaTVMediaPlayer(VidaaTVEntity, MediaPlayerEntity):
     """Representation of a Vidaa TV media player."""
 
+    __slots__ = (
+        "_apps",
+        "_sources",
+        "_sources_loaded",
+        "_sources_lock",
+    )
+
     _attr_device_class = MediaPlayerDeviceClass.TV
     _attr_name = None  # Use device name
 
@@ -67,7 +75,10 @@ class VidaaTVMediaPlayer(VidaaTVEntity, MediaPlayerEntity):
         # Source and app caches
         self._sources: list[str] = []
         self._apps: list[dict] = []
-        self._source_list: list[str] = []
+        self._attr_source_list: list[str] = []
+        self._sources_loaded = False
+        self._sources_lock = asyncio.Lock()
+        self._update_state()
 
     @property
     def available(self) -> bool:
@@ -77,81 +88,93 @@ class VidaaTVMediaPlayer(VidaaTVEntity, MediaPlayerEntity):
         """
         return True
 
-    @property
-    def state(self) -> MediaPlayerState:
-        """Return the state of the TV."""
-        if not self.coordinator.data or not self.coordinator.available:
-            return MediaPlayerState.OFF
-
-        if self.coordinator.data.get("is_on"):
-            return MediaPlayerState.ON
-        return MediaPlayerState.OFF
-
-    @property
-    def volume_level(self) -> float | None:
-        """Return volume level (0.0 to 1.0)."""
-        if not self.coordinator.data:
-            return None
-
-        volume = self.coordinator.data.get("volume")
-        if volume is not None:
-            return volume / 100.0
-        return None
-
-    @property
-    def is_volume_muted(self) -> bool | None:
-        """Return if volume is muted."""
-        if not self.coordinator.data:
-            return None
-        return self.coordinator.data.get("is_muted", False)
-
-    @property
-    def source(self) -> str | None:
-        """Return current source."""
-        if not self.coordinator.data:
-            return None
-        return self.coordinator.data.get("source")
-
-    @property
-    def source_list(self) -> list[str]:
-        """Return list of available sources."""
-        return self._source_list
-
-    @property
-    def app_name(self) -> str | None:
-        """Return current app name."""
-        if not self.coordinator.data:
-            return None
-        return self.coordinator.data.get("app")
+    def _update_state(self) -> None:
+        """Cache the media player state from the latest coordinator data."""
+        data = self.coordinator.data
+        if not data:
+            self._attr_state = MediaPlayerState.OFF
+            self._attr_volume_level = None
+            self._attr_is_volume_muted = None
+            self._attr_source = None
+            self._attr_app_name = None
+            return
+
+        if data.get("is_on") and self.coordinator.available:
+            self._attr_state = MediaPlayerState.ON
+        else:
+            self._attr_state = MediaPlayerState.OFF
+
+        volume = data.get("volume")
+        self._attr_volume_level = volume / 100.0 if volume is not None else None
+        self._attr_is_volume_muted = data.get("is_muted", False)
+        self._attr_source = data.get("source")
+        self._attr_app_name = data.get("app")
 
     async def async_added_to_hass(self) -> None:
         """Run when entity is added to hass."""
         await super().async_added_to_hass()
-        await self._async_update_sources()
+        if self.coordinator.tv.is_connected:
+            self._async_schedule_sources_update()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_state()
+        # The TV connects in the background, so sources may not be known yet
+        if not self._sources_loaded and self.coordinator.tv.is_connected:
+            self._async_schedule_sources_update()
+        super()._handle_coordinator_update()
+
+    @callback
+    def _async_schedule_sources_update(self) -> None:
+        """Fetch the sources in the background, off the entity setup path."""
+        self._sources_loaded = True
+        self._entry.async_create_background_task(
+            self.hass,
+            self._async_update_sources(),
+            name=f"{self.entity_id}_update_sources",
+        )
 
     async def _async_update_sources(self) -> None:
         """Update source list from TV."""
-        try:
-            sources = await self.coordinator.async_get_sources()
-            if sources and isinstance(sources, list):
-                self._sources = sources
-                self._source_list = []
-                for s in sources:
-                    if isinstance(s, dict):
-                        name = s.get("sourcename", s.get("name", f"Source {s.get('sourceid', '?')}"))
-                        self._source_list.append(name)
-
-            apps = await self.coordinator.async_get_apps()
-            if apps and isinstance(apps, list):
-                self._apps = apps
-                for app in apps:
-                    if isinstance(app, dict):
-                        name = app.get("name")
-                        if name and name not in self._source_list:
-                            self._source_list.append(name)
-
-        except Exception as err:
-            _LOGGER.debug("Error updating sources: %s", err)
+        # One fetch at a time; the scheduled duplicate just returns
+        if self._sources_lock.locked():
+            return
+        async with self._sources_lock:
+            try:
+                sources = await self.coordinator.async_get_sources()
+                if sources and isinstance(sources, list):
+                    self._sources = sources
+                    source_list = []
+                    for s in sources:
+                        if isinstance(s, dict):
+                            name = s.get("sourcename", s.get("name", f"Source {s.get('sourceid', '?')}"))
+                            source_list.append(name)
+                else:
+                    source_list = list(self._attr_source_list or [])
+
+                # The library returns None rather than raising on a timeout;
+                # retry those on the next coordinator update
+                if not isinstance(sources, list):
+                    self._sources_loaded = False
+
+                apps = await self.coordinator.async_get_apps()
+                if apps and isinstance(apps, list):
+                    self._apps = apps
+                    for app in apps:
+                        if isinstance(app, dict):
+                            name = app.get("name")
+                            if name and name not in source_list:
+                                source_list.append(name)
+                elif not isinstance(apps, list):
+                    self._sources_loaded = False
+
+                self._attr_source_list = source_list
+                self.async_write_ha_state()
+            except Exception as err:
+                _LOGGER.debug("Error updating sources: %s", err)
+                # Retry on the next coordinator update
+                self._sources_loaded = False
 
     async def async_turn_on(self) -> None:
         """Turn the TV on."""
@@ -0,0 +1,13 @@
+"""Type aliases for the Vidaa TV integration."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from homeassistant.config_entries import ConfigEntry
+
+if TYPE_CHECKING:
+    from . import VidaaTVRuntimeData  # noqa: F401
+
+# Python 3.11 compatible type alias (not 3.12+ type statement)
+VidaaTVConfigEntry = ConfigEntry["VidaaTVRuntimeData"]
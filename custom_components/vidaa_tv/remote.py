@@ -4,11 +4,12 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Iterable
 
 from homeassistant.components.remote import RemoteEntity, RemoteEntityFeature
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .coordinator import VidaaTVDataUpdateCoordinator
@@ -17,10 +18,14 @@ from .entity import VidaaTVEntity
 from vidaa.keys import get_key
 
 if TYPE_CHECKING:
-    from . import VidaaTVConfigEntry
+    from .models import VidaaTVConfigEntry
 
 _LOGGER = logging.getLogger(__name__)
 
+# get_key is pure but scans the ALL_KEYS list on a miss in its name map;
+# bounded since the command names come from user input
+_get_key = lru_cache(maxsize=256)(get_key)
+
 PARALLEL_UPDATES = 1
 
 
@@ -37,6 +42,12 @@ async def async_setup_entry(
 class VidaaTVRemote(VidaaTVEntity, RemoteEntity):
     """Representation of a Vidaa TV remote."""
 
+    __slots__ = (
+        "_activities_loaded",
+        "_activities_lock",
+        "_apps_by_name",
+    )
+
     _attr_name = "Remote"
     _attr_supported_features = RemoteEntityFeature.ACTIVITY
 
@@ -47,71 +58,103 @@ class VidaaTVRemote(VidaaTVEntity, RemoteEntity):
     ) -> None:
         """Initialize the remote."""
         super().__init__(coordinator, entry)
-        self._attr_unique_id = f"{self._device_id}_remote" if self._device_id else f"{entry.entry_id}_remote"
-        self._apps: list[dict] = []
-        self._activity_list: list[str] = []
+        self._attr_unique_id = f"{self._unique_id_base}_remote"
+        # Launch payloads by app name, so a known activity starts without
+        # the library fetching the app list from the TV again
+        self._apps_by_name: dict[str, dict[str, Any]] = {}
+        self._activities_loaded = False
+        self._activities_lock = asyncio.Lock()
+        self._update_state()
 
     async def async_added_to_hass(self) -> None:
         """Run when entity is added to hass."""
         await super().async_added_to_hass()
-        await self._async_update_activities()
+        if self.coordinator.tv.is_connected:
+            self._async_schedule_activities_update()
+
+    def _update_state(self) -> None:
+        """Cache power state and activity from the latest coordinator data."""
+        data = self.coordinator.data
+        if data:
+            self._attr_is_on = data.get("is_on", False)
+            self._attr_current_activity = data.get("app") or data.get("source")
+        else:
+            self._attr_is_on = None
+            self._attr_current_activity = None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_state()
+        # The TV connects in the background, so apps may not be known yet
+        if not self._activities_loaded and self.coordinator.tv.is_connected:
+            self._async_schedule_activities_update()
+        super()._handle_coordinator_update()
+
+    @callback
+    def _async_schedule_activities_update(self) -> None:
+        """Fetch the activities in the background, off the entity setup path."""
+        self._activities_loaded = True
+        self._entry.async_create_background_task(
+            self.hass,
+            self._async_update_activities(),
+            name=f"{self.entity_id}_update_activities",
+        )
 
     async def _async_update_activities(self) -> None:
         """Update activity list from TV."""
-        try:
-            apps = await self.coordinator.async_get_apps()
-            if apps:
-                self._apps = apps
-                self._activity_list = [app.get("name") for app in apps if app.get("name")]
-        except Exception as err:
-            _LOGGER.debug("Error updating activities: %s", err)
-
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        return self.coordinator.available
-
-    @property
-    def is_on(self) -> bool | None:
-        """Return if TV is on."""
-        if not self.coordinator.data:
-            return None
-        return self.coordinator.data.get("is_on", False)
-
-    @property
-    def current_activity(self) -> str | None:
-        """Return current activity (app name or source)."""
-        if not self.coordinator.data:
-            return None
-        return self.coordinator.data.get("app") or self.coordinator.data.get("source")
-
-    @property
-    def activity_list(self) -> list[str] | None:
-        """Return list of activities (apps)."""
-        return self._activity_list if self._activity_list else None
+        # One fetch at a time; the scheduled duplicate just returns
+        if self._activities_lock.locked():
+            return
+        async with self._activities_lock:
+            try:
+                apps = await self.coordinator.async_get_apps()
+                if apps:
+                    self._apps_by_name = {
+                        app["name"]: {
+                            "appId": app.get("appId"),
+                            "name": app["name"],
+                            "url": app.get("url"),
+                        }
+                        for app in apps
+                        if app.get("name")
+                    }
+                    self._attr_activity_list = list(self._apps_by_name) or None
+                elif not isinstance(apps, list):
+                    # The library returns None rather than raising on a
+                    # timeout; retry on the next coordinator update
+                    self._activities_loaded = False
+                self.async_write_ha_state()
+            except Exception as err:
+                _LOGGER.debug("Error updating activities: %s", err)
+                # Retry on the next coordinator update
+                self._activities_loaded = False
 
     async def async_turn_on(self, activity: str | None = None, **kwargs: Any) -> None:
         """Turn the TV on and optionally start an activity."""
-        await self.coordinator.async_turn_on()
+        if await self.coordinator.async_turn_on():
+            self.coordinator.async_set_optimistic(is_on=True)
         if activity:
-            await self.coordinator.async_launch_app(activity)
+            await self.coordinator.async_launch_app(
+                self._apps_by_name.get(activity, activity)
+            )
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the TV off."""
-        await self.coordinator.async_turn_off()
+        if await self.coordinator.async_turn_off():
+            self.coordinator.async_set_optimistic(is_on=False)
 
     async def async_send_command(self, command: Iterable[str], **kwargs: Any) -> None:
         """Send remote commands."""
         num_repeats = kwargs.get("num_repeats", 1)
         delay_secs = kwargs.get("delay_secs", 0.2)
 
-        for _ in range(num_repeats):
-            for cmd in command:
-                key = get_key(cmd)
-                await self.coordinator.async_send_key(key)
-
-                if delay_secs > 0:
-                    await asyncio.sleep(delay_secs)
+        keys = [_get_key(cmd) for cmd in command] * num_repeats
+        # A zero delay asks for the keys to go out as one burst
+        if delay_secs > 0:
+            await self.coordinator.async_send_keys(keys, delay_secs)
+        else:
+            await self.coordinator.async_send_keys_burst(keys)
 
     async def async_learn_command(self, **kwargs: Any) -> None:
         """Learn a command (not supported)."""
@@ -2,20 +2,24 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .coordinator import VidaaTVDataUpdateCoordinator
 from .entity import VidaaTVEntity
 
 if TYPE_CHECKING:
-    from . import VidaaTVConfigEntry
+    from .models import VidaaTVConfigEntry
 
-PARALLEL_UPDATES = 1
+# Sensors only read coordinator data, so updates need no throttling
+PARALLEL_UPDATES = 0
+
+# Stands in for coordinator data before the first successful poll
+_EMPTY: dict[str, Any] = {}
 
 
 async def async_setup_entry(
@@ -40,14 +44,18 @@ class VidaaTVAppSensor(VidaaTVEntity, SensorEntity):
     def __init__(self, coordinator: VidaaTVDataUpdateCoordinator, entry: ConfigEntry) -> None:
         """Initialize the app sensor."""
         super().__init__(coordinator, entry)
-        self._attr_unique_id = f"{self._device_id}_sensor_app" if self._device_id else f"{entry.entry_id}_sensor_app"
+        self._attr_unique_id = f"{self._unique_id_base}_sensor_app"
+        self._update_native_value()
+
+    def _update_native_value(self) -> None:
+        """Cache the current app name from the latest coordinator data."""
+        self._attr_native_value = (self.coordinator.data or _EMPTY).get("app")
 
-    @property
-    def native_value(self) -> str | None:
-        """Return current app name."""
-        if not self.coordinator.data:
-            return None
-        return self.coordinator.data.get("app")
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_native_value()
+        super()._handle_coordinator_update()
 
 
 class VidaaTVSourceSensor(VidaaTVEntity, SensorEntity):
@@ -59,11 +67,15 @@ class VidaaTVSourceSensor(VidaaTVEntity, SensorEntity):
     def __init__(self, coordinator: VidaaTVDataUpdateCoordinator, entry: ConfigEntry) -> None:
         """Initialize the source sensor."""
         super().__init__(coordinator, entry)
-        self._attr_unique_id = f"{self._device_id}_sensor_source" if self._device_id else f"{entry.entry_id}_sensor_source"
-
-    @property
-    def native_value(self) -> str | None:
-        """Return current source name."""
-        if not self.coordinator.data:
-            return None
-        return self.coordinator.data.get("source")
+        self._attr_unique_id = f"{self._unique_id_base}_sensor_source"
+        self._update_native_value()
+
+    def _update_native_value(self) -> None:
+        """Cache the current source name from the latest coordinator data."""
+        self._attr_native_value = (self.coordinator.data or _EMPTY).get("source")
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_native_value()
+        super()._handle_coordinator_update()
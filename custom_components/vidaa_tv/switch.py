@@ -6,14 +6,14 @@ from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .coordinator import VidaaTVDataUpdateCoordinator
 from .entity import VidaaTVEntity
 
 if TYPE_CHECKING:
-    from . import VidaaTVConfigEntry
+    from .models import VidaaTVConfigEntry
 
 PARALLEL_UPDATES = 1
 
@@ -31,6 +31,8 @@ async def async_setup_entry(
 class VidaaTVMuteSwitch(VidaaTVEntity, SwitchEntity):
     """Switch to toggle mute on the TV."""
 
+    __slots__ = ("_is_muted",)
+
     _attr_name = "Mute"
     _attr_icon = "mdi:volume-off"
 
@@ -41,21 +43,33 @@ class VidaaTVMuteSwitch(VidaaTVEntity, SwitchEntity):
     ) -> None:
         """Initialize the mute switch."""
         super().__init__(coordinator, entry)
-        self._attr_unique_id = f"{self._device_id}_switch_mute" if self._device_id else f"{entry.entry_id}_switch_mute"
+        self._attr_unique_id = f"{self._unique_id_base}_switch_mute"
+        self._is_muted: bool | None = None
+        self._update_is_muted()
+
+    def _update_is_muted(self) -> None:
+        """Cache the mute state from the latest coordinator data."""
+        data = self.coordinator.data
+        self._is_muted = data.get("is_muted", False) if data else None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_is_muted()
+        super()._handle_coordinator_update()
 
     @property
     def is_on(self) -> bool | None:
         """Return True if muted."""
-        if not self.coordinator.data:
-            return None
-        return self.coordinator.data.get("is_muted", False)
+        return self._is_muted
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Mute the TV."""
-        if self.is_on is not True:
-            await self.coordinator.async_mute()
+        # Mute is a toggle on the TV, so only send it when the state differs
+        if self._is_muted is not True and await self.coordinator.async_mute():
+            self.coordinator.async_set_optimistic(is_muted=True)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Unmute the TV."""
-        if self.is_on is True:
-            await self.coordinator.async_mute()
+        if self._is_muted is True and await self.coordinator.async_mute():
+            self.coordinator.async_set_optimistic(is_muted=False)
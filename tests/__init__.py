@@ -0,0 +1 @@
+"""Tests for the Vidaa TV integration."""
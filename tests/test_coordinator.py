@@ -0,0 +1,61 @@
+"""Tests for the Vidaa TV coordinator."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+from homeassistant.exceptions import HomeAssistantError
+
+from custom_components.vidaa_tv.coordinator import VidaaTVDataUpdateCoordinator
+
+
+class _EagerHass:
+    """Minimal hass that runs new tasks eagerly, as HA does on Python 3.12+."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self.loop = loop
+
+    def async_create_task(self, coro):
+        # Only flushes that finish without suspending are exercised here
+        try:
+            coro.send(None)
+        except StopIteration:
+            done = self.loop.create_future()
+            done.set_result(None)
+            return done
+        coro.close()
+        raise AssertionError("task suspended")
+
+    async def async_add_executor_job(self, func, *args):
+        return func(*args)
+
+
+def _make_coordinator(hass: _EagerHass) -> VidaaTVDataUpdateCoordinator:
+    """Build a coordinator with just the key-sending state."""
+    coordinator = object.__new__(VidaaTVDataUpdateCoordinator)
+    coordinator.hass = hass
+    coordinator.tv = Mock(is_connected=False)
+    coordinator._pending_keys = []
+    coordinator._flush_task = None
+    coordinator._send_lock = asyncio.Lock()
+    coordinator._connect_lock = asyncio.Lock()
+    return coordinator
+
+
+@pytest.mark.asyncio
+async def test_key_press_after_flush_failed_before_first_await() -> None:
+    """A flush that finishes before its first await must not block later presses."""
+    coordinator = _make_coordinator(_EagerHass(asyncio.get_running_loop()))
+
+    # A poll holding the connect lock makes the flush fail synchronously
+    await coordinator._connect_lock.acquire()
+    with pytest.raises(HomeAssistantError):
+        await coordinator.async_send_key("KEY_OK")
+    coordinator._connect_lock.release()
+
+    coordinator.tv.is_connected = True
+    await asyncio.wait_for(coordinator.async_send_key("KEY_UP"), timeout=1)
+
+    coordinator.tv.send_key.assert_called_once_with("KEY_UP")